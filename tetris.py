@@ -2,13 +2,14 @@
 import pygame
 import sys
 import random
-import math
+import numpy as np
 
 # --- 常量设置 ---
 GRID_SIZE = 30  # 单位网格尺寸（可缩放）
 GRID_WIDTH = 10  # 游戏区域列数（宽度）
 GRID_HEIGHT = 20  # 游戏区域行数（高度）
 FPS = 60  # 帧数
+MAX_PARTICLES = 512  # 粒子数量上限（防止连续消行时无限增长）
 
 # --- 方块形状设置 ---
 SHAPES = [
@@ -21,6 +22,43 @@ SHAPES = [
     [[0, 1, 1], [1, 1, 0]]  # Z
 ]
 
+# --- 位板辅助 ---
+SHAPE_BITS_CACHE = {}  # 形状矩阵 -> (按列位掩码, 宽, 高)（每种形状最多 4 个旋转变体）
+
+
+def shape_bits(shape):
+    """ 形状的按列位掩码（第 r 位对应第 r 行）与包围盒尺寸，结果按矩阵缓存 """
+    # ROTATIONS 里的矩阵本身就是元组，可直接作键，省去每次调用重建键
+    key = shape if type(shape) is tuple else tuple(tuple(row) for row in shape)
+    bits = SHAPE_BITS_CACHE.get(key)
+    if bits is None:
+        cols = [0] * len(shape[0])
+        for r, row in enumerate(shape):
+            for c, cell in enumerate(row):
+                if cell:
+                    cols[c] |= 1 << r
+        bits = (tuple(cols), len(shape[0]), len(shape))
+        SHAPE_BITS_CACHE[key] = bits
+    return bits
+
+
+def build_rotations():
+    """ 预计算每个形状的全部旋转变体（去重），并预热列掩码缓存 """
+    table = []
+    for shape in SHAPES:
+        rots = []
+        cur = tuple(tuple(row) for row in shape)
+        while cur not in rots:
+            rots.append(cur)
+            shape_bits(cur)
+            cur = tuple(zip(*cur[::-1]))
+        table.append(rots)
+    return table
+
+
+ROTATIONS = build_rotations()  # ROTATIONS[shape_id][rot] -> 旋转后的形状矩阵
+
+
 # --- 解析度设置 ---
 RESOLUTIONS = [
     (800, 600),  # 600p
@@ -28,6 +66,7 @@ RESOLUTIONS = [
     (1600, 900),  # 900p
     (1920, 1080)  # 1080p
 ]
+RESOLUTION_BY_TEXT = {f"{w}x{h}": (w, h) for w, h in RESOLUTIONS}  # 显示文本 -> 分辨率
 
 
 # --- 游戏状态枚举 ---
@@ -40,12 +79,23 @@ class GameState:
     PAUSED = 5  # 暂停菜单
 
 
+STATE_FPS = {  # 各界面的帧率上限：菜单动画稀疏，不必以游戏帧率空转
+    GameState.MAIN_MENU: 30,
+    GameState.LEVEL_SELECT: 30,
+    GameState.OPTIONS: 30,
+    GameState.GAME: FPS,
+    GameState.GAME_OVER: 30,
+    GameState.PAUSED: 15
+}
+
+
 # --- 颜色方案 ---
 class ColorScheme:
     BACKGROUND = pygame.Color("#1A237E")  # 主要背景颜色
     TEXT = pygame.Color("#FFFFFF")  # 文字颜色
     BUTTON = pygame.Color("#3F51B5")  # 按钮颜色
     BUTTON_HOVER = pygame.Color("#5C6BC0")  # 按钮高亮颜色
+    BUTTON_DISABLED = pygame.Color("#808080")  # 按钮置灰颜色
     GRID_LINE = pygame.Color("#303F9F")  # 网格线颜色
     SHAPE_COLORS = [  # 方块颜色
         pygame.Color("#00BCD4"),  # I
@@ -59,30 +109,52 @@ class ColorScheme:
 
 
 # --- 模糊处理 ---
-def apply_blur(surface, factor=4):
-    """ 通过平均采样实现模糊效果 """
-    small = pygame.transform.smoothscale(surface,
-                                         (surface.get_width() // factor, surface.get_height() // factor))
-    return pygame.transform.smoothscale(small, surface.get_size())
+def apply_blur(surface, factor=8):
+    """ 通过采样实现模糊效果：快速邻近缩小后再平滑放大 """
+    small = pygame.transform.scale(surface,
+                                   (surface.get_width() // factor, surface.get_height() // factor))
+    # 结果完全不透明，convert 后按无 alpha 路径绘制
+    return pygame.transform.smoothscale(small, surface.get_size()).convert()
+
+
+# --- 字体缓存 ---
+FONT_CACHE = {}  # 字号 -> Font 对象
+
+
+def get_font(size):
+    """ 按字号复用 Font 对象，避免每次构建 FreeType 字体 """
+    font = FONT_CACHE.get(size)
+    if font is None:
+        font = FONT_CACHE[size] = pygame.font.Font(None, size)
+    return font
 
 
 # --- 按钮 ---
 class Button:
+    _font = None  # 所有按钮共享的字体（首次创建按钮时加载）
+
     def __init__(self, text, x, y, width, height, action=None):
         """ 游戏界面按钮组件 """
+        if Button._font is None:
+            Button._font = get_font(36)  # 设置字体（只加载一次）
         self.rect = pygame.Rect(x, y, width, height)  # 按钮的矩形
         self.text = text  # 按钮文本
         self.action = action  # 点击事件
         self.hovered = False  # 是否高亮
+        self.text_surf = Button._font.render(text, True, ColorScheme.TEXT)  # 缓存的文本表面
+
+    def set_text(self, text):
+        """ 修改按钮文本，仅在内容变化时重新渲染 """
+        if text != self.text:
+            self.text = text
+            self.text_surf = Button._font.render(text, True, ColorScheme.TEXT)
 
     def draw(self, surface):
         """ 按钮绘制 """
         color = ColorScheme.BUTTON_HOVER if self.hovered else ColorScheme.BUTTON  # 按钮颜色
         pygame.draw.rect(surface, color, self.rect)  # 绘制按钮
-        font = pygame.font.Font(None, 36)  # 设置字体
-        text_surf = font.render(self.text, True, ColorScheme.TEXT)  # 创建文本
-        text_rect = text_surf.get_rect(center=self.rect.center)  # 创建文本的位置
-        surface.blit(text_surf, text_rect)  # 绘制文本
+        text_rect = self.text_surf.get_rect(center=self.rect.center)  # 文本居中位置
+        surface.blit(self.text_surf, text_rect)  # 绘制文本
 
 
 class Tetris:
@@ -90,18 +162,21 @@ class Tetris:
         self.game = None  # 初始化game为None
 
         # 游戏区域相关
-        self.grid = [[0] * GRID_WIDTH for _ in range(GRID_HEIGHT)]  # 二维列表网格表示游戏区域
+        self.grid = [[0] * GRID_WIDTH for _ in range(GRID_HEIGHT)]  # 二维列表网格记录颜色（仅渲染用）
+        self.cols = [0] * GRID_WIDTH  # 位板：每列一个 20 位整数，第 r 位对应第 r 行
 
         # 形状相关
-        self.current_shape = None  # 当前形状
+        self.shape_id = 0  # 当前形状编号
+        self.rot = 0  # 当前旋转编号
+        self.current_shape = None  # 当前形状矩阵（查表所得，渲染用）
         self.shape_color = 0  # 当前形状颜色
-        self.next_shape = self.choose_shape()  # 下个形状
+        self.next_shape_id = self.choose_shape()  # 下个形状编号
         self.next_color = self.choose_next_color()  # 下个形状的颜色
 
         # 信息记录与规则控制相关
         self.score = 0  # 分数
         self.level = level  # 当前关卡（难度等级）
-        self.last_fall = pygame.time.get_ticks()  # 上次下落时间
+        self.fall_accum = 0  # 下落计时累计的毫秒数
         self.fall_speed = max(50, 1000 - (level - 1) * 100)  # 下落速度
         self.new_shape()  # 控制下落速度
         self.game_over = False  # 游戏结束标志
@@ -115,40 +190,61 @@ class Tetris:
         self.score_effect = None  # 加分特效
         self.score_effect_frames = 0  # 加分特效持续时间
         self.score_effect_position = (0, 0)  # 加分特效的位置
-        self.particles = []  # 存储粒子效果
-
-    class Particle:
-        def __init__(self, x, y, color):
-            self.x = x
-            self.y = y
-            self.color = color
-            self.size = random.randint(2, 4)
-            self.life = 60  # 粒子存活时间（帧数）
-            self.vx = random.uniform(-3, 3)
-            self.vy = random.uniform(-5, -2)
-            self.gravity = 0.25
+        self.particles = self.new_particles()  # 粒子效果（SoA 数组集合）
+
+    def new_particles(self):
+        """ 空的粒子集合：每个字段一个 numpy 数组（SoA 结构） """
+        return {
+            'px': np.empty(0, np.float32),  # 位置
+            'py': np.empty(0, np.float32),
+            'vx': np.empty(0, np.float32),  # 速度
+            'vy': np.empty(0, np.float32),
+            'life': np.empty(0, np.int16),  # 存活时间（帧数）
+            'color': np.empty(0, np.int8),  # SHAPE_COLORS 下标
+            'size': np.empty(0, np.int8)  # 粒子大小
+        }
+
+    def spawn_particles(self, xs, ys, colors):
+        """ 批量追加粒子，速度与大小用随机数组一次性生成 """
+        n = len(xs)
+        p = self.particles
+        p['px'] = np.concatenate([p['px'], np.asarray(xs, np.float32)])
+        p['py'] = np.concatenate([p['py'], np.asarray(ys, np.float32)])
+        p['vx'] = np.concatenate([p['vx'], np.random.uniform(-3, 3, n).astype(np.float32)])
+        p['vy'] = np.concatenate([p['vy'], np.random.uniform(-5, -2, n).astype(np.float32)])
+        p['life'] = np.concatenate([p['life'], np.full(n, 60, np.int16)])
+        p['color'] = np.concatenate([p['color'], np.asarray(colors, np.int8)])
+        p['size'] = np.concatenate([p['size'], np.random.randint(2, 5, n).astype(np.int8)])
+        if len(p['px']) > MAX_PARTICLES:  # 超出上限时只保留最新的粒子
+            for key in p:
+                p[key] = p[key][-MAX_PARTICLES:]
 
     def update_particles(self):
-        for p in self.particles[:]:
-            p.x += p.vx
-            p.y += p.vy
-            p.vy += p.gravity
-            p.life -= 1
-            if p.life <= 0:
-                self.particles.remove(p)
+        p = self.particles
+        if not len(p['px']):
+            return
+        p['px'] += p['vx']
+        p['py'] += p['vy']
+        p['vy'] += 0.25  # 重力
+        p['life'] -= 1
+        alive = p['life'] > 0
+        if not alive.all():  # 压缩掉死亡的粒子
+            for key in p:
+                p[key] = p[key][alive]
 
     def choose_shape(self):
-        """ 根据设置选择下一个形状 """
-        if self.game and self.game.disable_sz_shapes:  # 过滤掉S和Z型方块（SHAPES[5]和SHAPES[6]）
-            available_shapes = [shape for i, shape in enumerate(SHAPES) if i not in [5, 6]]
-            return random.choice(available_shapes)
-        return random.choice(SHAPES)
+        """ 根据设置选择下一个形状（返回形状编号） """
+        if self.game:
+            return random.choice(self.game.shape_pool)  # 编号池已按设置预先筛好
+        return random.randrange(len(SHAPES))
 
     def new_shape(self):
         """ 生成新方块并检查结束条件 """
-        self.current_shape = self.next_shape  # 交换形状
+        self.shape_id = self.next_shape_id  # 交换形状
+        self.rot = 0  # 新方块从初始旋转开始
+        self.current_shape = ROTATIONS[self.shape_id][0]
         self.shape_color = self.next_color  # 交换颜色
-        self.next_shape = self.choose_shape()  # 预选下个形状
+        self.next_shape_id = self.choose_shape()  # 预选下个形状
         self.next_color = self.choose_next_color()  # 预选下个形状颜色
         self.shape_x = GRID_WIDTH // 2 - len(self.current_shape[0]) // 2  # 生成位置在水平中央
         self.shape_y = 0  # 生成位置在顶部
@@ -156,21 +252,25 @@ class Tetris:
             self.game_over = True  # 游戏结束
 
     def check_collision(self, x, y, shape):
-        """ 检测碰撞 """
-        for row in range(len(shape)):
-            for col in range(len(shape[row])):
-                if shape[row][col]:
-                    if x + col < 0 or x + col >= GRID_WIDTH or \
-                            y + row >= GRID_HEIGHT or \
-                            (y + row >= 0 and self.grid[y + row][x + col]):
-                        return True
+        """ 检测碰撞（包围盒常数判界 + 逐列对位板做与运算） """
+        cols, width, height = shape_bits(shape)
+        if x < 0 or x + width > GRID_WIDTH:  # 超出左右边界
+            return True
+        if y + height > GRID_HEIGHT:  # 超出底部
+            return True
+        board = self.cols
+        for i, mask in enumerate(cols):
+            if board[x + i] & (mask << y):  # 与已锁定的方块重叠
+                return True
         return False
 
     def rotate(self):
-        """ 旋转方块 """
-        rotated = list(zip(*self.current_shape[::-1]))  # 矩阵转置
-        if not self.check_collision(self.shape_x, self.shape_y, rotated):  # 检查旋转后是否与上下边缘碰撞
-            self.current_shape = rotated  # 更新形状
+        """ 旋转方块（查预计算的旋转表） """
+        rots = ROTATIONS[self.shape_id]
+        new_rot = (self.rot + 1) % len(rots)
+        if not self.check_collision(self.shape_x, self.shape_y, rots[new_rot]):  # 检查旋转后是否与边缘碰撞
+            self.rot = new_rot  # 更新旋转编号
+            self.current_shape = rots[new_rot]
 
     def move(self, dx):
         """ 水平移动方块 """
@@ -184,18 +284,33 @@ class Tetris:
             self.shape_y -= 1  # 退回
             self.lock_shape()  # 锁定形状
 
+    def landing_y(self, x, y, shape):
+        """ 计算从 (x, y) 直落的落点行（逐列位运算，不做逐格试探） """
+        drop = GRID_HEIGHT  # 可下落距离的上界
+        for i, mask in enumerate(shape_bits(shape)[0]):
+            if not mask:
+                continue
+            low = (mask & -mask).bit_length() - 1  # 该列最高格的行偏移
+            height = mask.bit_length() - low  # 该列的连续格数
+            rel = self.cols[x + i] >> (y + low)  # 当前位置以下的盘面位
+            if rel:
+                dist = (rel & -rel).bit_length() - 1 - height  # 落在下方第一个已占格之上
+            else:
+                dist = GRID_HEIGHT  # 该列下方无阻挡
+            floor = GRID_HEIGHT - (y + low + height)  # 底部限制
+            if floor < dist:
+                dist = floor
+            if dist < drop:
+                drop = dist
+        return y + drop
+
     def hard_drop(self):
         """ 硬下落 """
         self.hard_drop_shape = self.current_shape  # 记录硬下落时的方块形状
 
-        # 计算幽灵方块位置
-        ghost_y = self.shape_y
-        while not self.check_collision(self.shape_x, ghost_y + 1, self.current_shape):
-            ghost_y += 1
-        self.ghost_effect_position = (self.shape_x, ghost_y)  # 记录幽灵方块的位置
-
-        while not self.check_collision(self.shape_x, self.shape_y + 1, self.current_shape):
-            self.shape_y += 1
+        # 幽灵位置与落点相同，逐列一次算出，免去两轮逐格碰撞测试
+        self.shape_y = self.landing_y(self.shape_x, self.shape_y, self.current_shape)
+        self.ghost_effect_position = (self.shape_x, self.shape_y)  # 记录幽灵方块的位置
         self.lock_shape()
         self.hard_drop_triggered = True  # 触发震动
 
@@ -206,47 +321,71 @@ class Tetris:
 
     def lock_shape(self):
         """ 锁定形状 """
+        cols, width, height = shape_bits(self.current_shape)
+        for i, mask in enumerate(cols):
+            self.cols[self.shape_x + i] |= mask << self.shape_y
         for row in range(len(self.current_shape)):
             for col in range(len(self.current_shape[row])):
                 if self.current_shape[row][col]:
                     self.grid[self.shape_y + row][self.shape_x + col] = self.shape_color + 1
 
+        # 整行检测：只有本次锁定覆盖的行可能被填满，所有列位板做与运算
+        full = ((1 << height) - 1) << self.shape_y
+        for c in self.cols:
+            full &= c
+
         lines = 0
-        for row in range(len(self.grid)):
-            if all(self.grid[row]):
-                del self.grid[row]
-                self.grid.insert(0, [0] * GRID_WIDTH)
-                lines += 1
+        if full:
+            # 位板消行：自顶向下逐行切除被填满的位
+            for y in range(GRID_HEIGHT):
+                if full & (1 << y):
+                    keep_below = ~((1 << (y + 1)) - 1)  # 第 y 行以下的位保持不动
+                    for i, c in enumerate(self.cols):
+                        self.cols[i] = ((c & ((1 << y) - 1)) << 1) | (c & keep_below)
+                    lines += 1
+            # 颜色网格消行：自底向上双指针压缩，存活行原地下移
+            write = GRID_HEIGHT - 1
+            for read in range(GRID_HEIGHT - 1, -1, -1):
+                if not (full & (1 << read)):
+                    self.grid[write] = self.grid[read]
+                    write -= 1
+            for i in range(write, -1, -1):
+                self.grid[i] = [0] * GRID_WIDTH
 
         # 消除积分计算 = 每行基础分 10 * 行数
         if lines > 0:
             # 生成破裂粒子
+            xs, ys, colors = [], [], []
             for y in range(len(self.grid)):
                 for x in range(GRID_WIDTH):
                     if self.grid[y][x]:
                         # 生成5-8个粒子
                         for _ in range(random.randint(5, 8)):
-                            px = (x + 0.5) * self.game.grid_size + self.game.game_area_x
-                            py = (y + 0.5) * self.game.grid_size + self.game.game_area_y
-                            self.particles.append(self.Particle(px, py,
-                                                                ColorScheme.SHAPE_COLORS[self.grid[y][x] - 1]))
+                            xs.append((x + 0.5) * self.game.grid_size + self.game.game_area_x)
+                            ys.append((y + 0.5) * self.game.grid_size + self.game.game_area_y)
+                            colors.append(self.grid[y][x] - 1)
+            if xs:
+                self.spawn_particles(xs, ys, colors)
             base_score = 10 * lines
             multiplier = lines
             self.score += base_score * multiplier
             self.score_effect = f"+{base_score * multiplier}"
             self.score_effect_frames = 45  # 增加特效持续时间
             self.score_effect_position = (self.shape_x, self.shape_y)
-            self.score_effect_scale = 1.0  # 缩放比例
-            self.score_effect_color = (0, 255, 0)  # 初始颜色
 
+        if self.game:
+            self.game.grid_dirty = True  # 盘面已变化，通知重建烘焙表面
         self.new_shape()
         self.hard_drop_triggered = False  # 重置震动触发标志
 
-    def update(self):
-        now = pygame.time.get_ticks()
-        if now - self.last_fall > self.fall_speed:
+    def update(self, dt):
+        """ 按帧间隔累计下落计时（长帧会补齐多次下落） """
+        self.fall_accum += dt
+        while self.fall_accum > self.fall_speed:
             self.drop()
-            self.last_fall = now
+            self.fall_accum -= self.fall_speed
+            if self.game_over:
+                break
 
     def choose_next_color(self):
         """选择下一个方块的颜色"""
@@ -266,6 +405,7 @@ class Game:
         self.screen_shake_enabled = True
         self.shake_intensity = 5  # 震动强度
         self.disable_sz_shapes = False  # 禁用S和Z型方块
+        self.shape_pool = list(range(len(SHAPES)))  # 可选形状编号池（随设置一起更新）
         self.temp_settings = {
             "fullscreen": self.fullscreen,
             "resolution": self.resolution,
@@ -277,12 +417,17 @@ class Game:
         self.screen_shake_enabled = self.temp_settings["screen_shake"]
         self.grid_size = GRID_SIZE
         self.scale_factor = 1.0  # 缩放比例
+        self.build_buttons()
         self.init_display()
         self.state = GameState.MAIN_MENU
         self.prev_state = GameState.MAIN_MENU
+        self.menu_dirty = True  # 静态菜单是否需要重绘（事件或背景动画推进时置位）
+        self.game_overdraw = False  # 上一帧游戏画面是否有越出分区的内容（粒子/震动等）
         self.clock = pygame.time.Clock()
         self.paused_surface = None
         self.paused_selected = 0
+        self.paused_option_rects = []  # 暂停菜单各选项的判定区域（绘制时更新）
+        self.paused_full_redraw = True  # 进入暂停后的第一帧整屏绘制，之后只更新菜单区域
         self.update_layout()
         self.title_letters = ['T', 'E', 'T', 'R', 'I', 'S']
         self.title_positions = [
@@ -295,24 +440,37 @@ class Game:
         ]
         self.title_center = (self.resolution[0] // 2, 150)
         self.title_speed = 0.02
+        self.build_title_glyphs()
         self.background_shapes = []
-        self.last_background_update = pygame.time.get_ticks()
-        self.background_update_interval = 500
+        self.dt = 0  # 上一帧耗时（毫秒，由主循环的 clock.tick 提供）
+        self.bg_accum = 0  # 背景方块移动计时累计的毫秒数
         self.init_background_shapes()
         self.showing_dropdown = False
         self.dropdown_rect = None
         self.dropdown_options = []
         self.dropdown_selected = 0
-        self.arrow_buttons = []
         self.update_layout()
         self.shake_offset = (0, 0)  # 震动偏移量
         self.shake_duration = 0  # 震动持续时间
         self.shake_intensity = 5  # 震动强度
+        # 预生成的随机偏移环形表（震动用，省去每帧的 randint 调用）
+        self.shake_table = np.random.randint(-10, 11, 4096).astype(np.int8)
+        self.shake_cursor = 0
 
     def init_display(self):
         flags = pygame.FULLSCREEN if self.fullscreen else 0
         self.screen = pygame.display.set_mode(self.resolution, flags)
         pygame.display.set_caption("Tetris")
+        self.text_cache = {}  # 文本表面缓存（字号随分辨率缩放，切换分辨率时整体失效）
+        self.score_surf = None  # 分数文本表面（按上次数值缓存，避免每个值都留在缓存里）
+        self.score_surf_value = None
+        self.final_score_surf = None  # 结算分数文本表面（同上，按上次数值缓存）
+        self.final_score_value = None
+        self.score_effect_cache = {}  # 加分文本 -> 预渲染的 45 帧特效序列
+        # 半透明深色蒙版（多处界面共用，切换分辨率时重建）
+        self.dark_overlay = pygame.Surface(self.resolution, pygame.SRCALPHA)
+        self.dark_overlay.fill((0, 0, 0, 128))
+        self.dark_overlay = self.dark_overlay.convert_alpha()
 
         # 计算缩放比例
         base_resolution = (800, 600)  # 将基础分辨率设置为800x600
@@ -322,30 +480,73 @@ class Game:
         # 根据缩放比例调整网格大小，缩小游戏区域和边框
         self.grid_size = int(GRID_SIZE * self.scale_factor * 0.9)  # 缩小10%
 
+        self.build_cell_sprites()
         self.update_layout()
 
+    def build_cell_sprites(self):
+        """ 预渲染单元格贴图（黑色描边+填充色烘焙在一起），供 blits 批量绘制 """
+        gs = self.grid_size
+        self.cell_sprites = {}
+        self.cell_fill_sprites = []  # 无描边纯色贴图（预览区用），按颜色编号索引
+        for color in ColorScheme.SHAPE_COLORS:
+            sprite = pygame.Surface((gs + 3, gs + 3))
+            sprite.fill(pygame.Color("#000000"))  # 黑色描边
+            pygame.draw.rect(sprite, color, (2, 2, gs - 1, gs - 1))  # 实际颜色
+            self.cell_sprites[tuple(color)] = sprite.convert()
+            fill = pygame.Surface((gs - 1, gs - 1))
+            fill.fill(color)
+            self.cell_fill_sprites.append(fill.convert())
+        # 幽灵方块的白色空心贴图
+        ghost = pygame.Surface((gs - 1, gs - 1), pygame.SRCALPHA)
+        pygame.draw.rect(ghost, pygame.Color("#FFFFFF"), (0, 0, gs - 1, gs - 1), 2)
+        self.ghost_sprite = ghost.convert_alpha()
+        # 幽灵方块消散特效的 30 帧贴图（按剩余帧数索引，免去每帧新建表面）
+        self.ghost_frames = []
+        for f in range(1, 31):
+            size = int(gs * (2 - f / 30))
+            frame = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.rect(frame, (255, 255, 255, int(255 * f / 30)), (0, 0, size, size), 2)
+            self.ghost_frames.append(frame.convert_alpha())
+        self.particle_sprites = {}  # (颜色编号, 半径) -> 圆形贴图，首次用到时生成
+        # 已锁定方块整体烘焙到一张表面，盘面变化时才重建
+        self.grid_surface = pygame.Surface(
+            (GRID_WIDTH * gs + 4, GRID_HEIGHT * gs + 4), pygame.SRCALPHA).convert_alpha()
+        self.grid_dirty = True
+
+    def render_text(self, s, size, color):
+        """ 渲染文本并按 (内容, 字号, 颜色) 缓存，静态字符串只栅格化一次 """
+        key = (s, size, tuple(color))
+        surf = self.text_cache.get(key)
+        if surf is None:
+            surf = get_font(size).render(s, True, color)
+            self.text_cache[key] = surf
+        return surf
+
     def init_background_shapes(self):
         """初始化背景形状"""
         self.background_shapes = []
         max_shapes = 20  # 最大背景方块数量
-        shape_size = self.grid_size  # 使用当前网格大小
+        self.bg_cell = self.grid_size * 4  # 每个方块占用4倍网格宽度/高度
 
         # 计算每行可以容纳的方块数量
-        columns = self.resolution[0] // (shape_size * 4)  # 每个方块占用4倍网格宽度
-        rows = self.resolution[1] // (shape_size * 4)  # 每个方块占用4倍网格高度
+        columns = max(1, self.resolution[0] // self.bg_cell)
+        rows = max(1, self.resolution[1] // self.bg_cell)
+
+        # 预先洗牌的列号池，滚出屏幕的方块循环取用下一列
+        self.bg_columns = list(range(columns))
+        random.shuffle(self.bg_columns)
+        self.bg_col_cursor = 0
 
         # 计算总方块数量，确保不超过最大数量且不重叠
         total_shapes = min(max_shapes, columns * rows)
 
-        # 生成不重叠的初始位置
-        occupied_positions = set()
-        for _ in range(total_shapes):
-            while True:
-                x = random.randint(0, columns - 1) * shape_size * 4
-                y = random.randint(-rows, 0) * shape_size * 4
-                if (x, y) not in occupied_positions:
-                    occupied_positions.add((x, y))
-                    break
+        # 预洗牌的 (列, 行) 槽位池保证初始位置互不重叠，不再做随机重试
+        slots = [(c, r) for c in range(columns) for r in range(-rows, 1)]
+        random.shuffle(slots)
+
+        for col, row in slots[:total_shapes]:
+            x = col * self.bg_cell
+            y = row * self.bg_cell
 
             shape = random.choice(SHAPES)
             color = random.choice(ColorScheme.SHAPE_COLORS)
@@ -353,170 +554,196 @@ class Game:
             self.background_shapes.append({
                 'shape': shape,
                 'color': color,
+                'surf': self.render_background_shape(shape, color),  # 整体预渲染的贴图
                 'x': x,
                 'y': y,
                 'speed': speed
             })
 
+    def render_background_shape(self, shape, color):
+        """ 把一个背景形状整体渲染成单张贴图（描边一并烘焙） """
+        gs = self.grid_size
+        surf = pygame.Surface((len(shape[0]) * gs + 3, len(shape) * gs + 3), pygame.SRCALPHA)
+        sprite = self.cell_sprites[tuple(color)]
+        for y, row in enumerate(shape):
+            for x, cell in enumerate(row):
+                if cell:
+                    surf.blit(sprite, (x * gs, y * gs))
+        return surf.convert_alpha()
+
     def update_background_shapes(self):
         """更新背景方块的位置"""
-        now = pygame.time.get_ticks()
-        if now - self.last_background_update > 700:  # 3级速度，700ms/格
+        self.bg_accum += self.dt
+        if self.bg_accum > 700:  # 3级速度，700ms/格
+            self.bg_accum = 0
+            self.menu_dirty = True  # 背景动画推进，静态菜单需要重绘
             for shape in self.background_shapes:
                 shape['y'] += shape['speed'] * self.grid_size
                 # 如果方块超出屏幕底部，则重置到顶部
                 if shape['y'] > self.resolution[1]:
                     shape['y'] = -len(shape['shape']) * self.grid_size
-                    # 重新随机x位置，确保不重叠
-                    columns = self.resolution[0] // (self.grid_size * 4)
-                    shape['x'] = random.randint(0, columns - 1) * self.grid_size * 4
-            self.last_background_update = now
+                    # 从列号池循环取下一列，免去每次重新随机
+                    shape['x'] = self.bg_columns[self.bg_col_cursor % len(self.bg_columns)] * self.bg_cell
+                    self.bg_col_cursor += 1
 
     def draw_background_shapes(self):
-        """绘制背景形状"""
-        for shape in self.background_shapes:
-            for y, row in enumerate(shape['shape']):
-                for x, cell in enumerate(row):
-                    if cell:
-                        # 绘制黑色描边
-                        pygame.draw.rect(self.screen, pygame.Color("#000000"), (
-                            shape['x'] + x * self.grid_size - 2,
-                            shape['y'] + y * self.grid_size - 2,
-                            self.grid_size + 3, self.grid_size + 3
-                        ))
-                        # 绘制实际颜色的方块
-                        pygame.draw.rect(self.screen, shape['color'], (
-                            shape['x'] + x * self.grid_size,
-                            shape['y'] + y * self.grid_size,
-                            self.grid_size - 1, self.grid_size - 1
-                        ))
+        """绘制背景形状（每个形状一张整体贴图）"""
+        if self.background_shapes:
+            self.screen.blits([(s['surf'], (s['x'] - 2, s['y'] - 2)) for s in self.background_shapes],
+                              doreturn=False)
 
     def draw_current_shape(self):
         color = self.tetris.get_shape_color()
 
         # 使用self.grid_size代替GRID_SIZE
         if self.ghost_shape_enabled:
-            ghost_y = self.tetris.shape_y
-            while not self.tetris.check_collision(self.tetris.shape_x, ghost_y + 1, self.tetris.current_shape):
-                ghost_y += 1
+            ghost_y = self.tetris.landing_y(self.tetris.shape_x, self.tetris.shape_y, self.tetris.current_shape)
 
             # 正常绘制幽灵方块
+            blits = []
             for y, row in enumerate(self.tetris.current_shape):
                 for x, cell in enumerate(row):
                     if cell:
-                        pygame.draw.rect(self.screen, pygame.Color("#FFFFFF"), (
+                        blits.append((self.ghost_sprite, (
                             self.game_area_x + (self.tetris.shape_x + x) * self.grid_size,
-                            self.game_area_y + (ghost_y + y) * self.grid_size,
-                            self.grid_size - 1, self.grid_size - 1
-                        ), 2)
+                            self.game_area_y + (ghost_y + y) * self.grid_size
+                        )))
+            self.screen.blits(blits, doreturn=False)
 
         # 绘制幽灵方块消散特效
-        if self.tetris.ghost_effect_active and self.ghost_shape_enabled:  # 仅在 ghost_shape_enabled 为 True 时显示消散特效
+        if self.tetris.ghost_effect_active and self.ghost_shape_enabled and self.tetris.ghost_effect_frames > 0:
+            # 仅在 ghost_shape_enabled 为 True 时显示消散特效，贴图按剩余帧数查表
+            ghost_surface = self.ghost_frames[self.tetris.ghost_effect_frames - 1]
+            offset = (ghost_surface.get_width() - self.grid_size) / 2
             for y, row in enumerate(self.tetris.hard_drop_shape):  # 使用硬下落时的方块形状
                 for x, cell in enumerate(row):
                     if cell:
-                        alpha = 255 * (self.tetris.ghost_effect_frames / 30)
-                        size = self.grid_size * (1 + (1 - self.tetris.ghost_effect_frames / 30))
-                        ghost_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-                        pygame.draw.rect(ghost_surface, (255, 255, 255, alpha), (0, 0, size, size), 2)
                         self.screen.blit(ghost_surface, (
-                            self.game_area_x + (self.tetris.ghost_effect_position[0] + x) * self.grid_size - (
-                                    size - self.grid_size) / 2,
-                            self.game_area_y + (self.tetris.ghost_effect_position[1] + y) * self.grid_size - (
-                                    size - self.grid_size) / 2
+                            self.game_area_x + (self.tetris.ghost_effect_position[0] + x) * self.grid_size - offset,
+                            self.game_area_y + (self.tetris.ghost_effect_position[1] + y) * self.grid_size - offset
                         ))
 
-        # 使用self.grid_size代替GRID_SIZE
+        # 使用self.grid_size代替GRID_SIZE（描边已烘焙进贴图）
+        sprite = self.cell_sprites[tuple(color)]
+        blits = []
         for y, row in enumerate(self.tetris.current_shape):
             for x, cell in enumerate(row):
                 if cell:
-                    # 先绘制黑色轮廓，增强描边效果
-                    pygame.draw.rect(self.screen, pygame.Color("#000000"), (
+                    blits.append((sprite, (
                         self.game_area_x + (self.tetris.shape_x + x) * self.grid_size - 2,
-                        self.game_area_y + (self.tetris.shape_y + y) * self.grid_size - 2,
-                        self.grid_size + 3, self.grid_size + 3
-                    ))
-                    # 再绘制实际颜色的方块
-                    pygame.draw.rect(self.screen, color, (
-                        self.game_area_x + (self.tetris.shape_x + x) * self.grid_size,
-                        self.game_area_y + (self.tetris.shape_y + y) * self.grid_size,
-                        self.grid_size - 1, self.grid_size - 1
-                    ))
+                        self.game_area_y + (self.tetris.shape_y + y) * self.grid_size - 2
+                    )))
+        self.screen.blits(blits, doreturn=False)
+
+    def build_buttons(self):
+        """ 一次性创建所有按钮，几何尺寸之后由 update_layout 原地更新 """
+        # 主菜单按钮
+        self.main_menu_buttons = [
+            Button("Start", 0, 0, 0, 0, self.show_levels),
+            Button("Options", 0, 0, 0, 0, self.show_options),
+            Button("Exit", 0, 0, 0, 0, sys.exit)
+        ]
+
+        # 关卡按钮
+        self.level_buttons = [Button(str(i), 0, 0, 0, 0, lambda l=i: self.start_game(l))
+                              for i in range(1, 11)]
+
+        # 箭头按钮按设置行成对生成
+        self.arrow_buttons = []
+        for row in range(6):
+            self.arrow_buttons.append(Button("<", 0, 0, 0, 0, lambda r=row: self.cycle_setting(r, -1)))
+            self.arrow_buttons.append(Button(">", 0, 0, 0, 0, lambda r=row: self.cycle_setting(r, 1)))
+
+        # 选项值按钮，文本由 refresh_option_texts 保持同步
+        self.options_buttons = [
+            Button("Off", 0, 0, 0, 0, self.toggle_fullscreen),
+            Button("", 0, 0, 0, 0, self.cycle_resolution),
+            Button("Off", 0, 0, 0, 0, self.toggle_ghost_shape),
+            Button("Off", 0, 0, 0, 0, self.toggle_screen_shake),
+            Button("", 0, 0, 0, 0, self.adjust_shake_intensity),
+            Button("Off", 0, 0, 0, 0, self.toggle_disable_sz_shapes),  # 禁用S/Z型方块按钮
+            Button("Apply", 0, 0, 0, 0, self.apply_settings),
+        ]
+        self.refresh_option_texts()
+
+    def refresh_option_texts(self):
+        """ 让选项按钮文本与待应用的配置保持一致 """
+        self.options_buttons[0].set_text("On" if self.temp_settings["fullscreen"] else "Off")
+        self.options_buttons[1].set_text(
+            f"{self.temp_settings['resolution'][0]}x{self.temp_settings['resolution'][1]}")
+        self.options_buttons[2].set_text("On" if self.temp_settings["ghost_shape"] else "Off")
+        self.options_buttons[3].set_text("On" if self.temp_settings["screen_shake"] else "Off")
+        self.options_buttons[4].set_text(str(self.temp_settings["shake_intensity"]))
+        self.options_buttons[5].set_text("On" if self.temp_settings["disable_sz_shapes"] else "Off")
 
     def update_layout(self):
         screen_width, screen_height = self.resolution
+        s = self.scale_factor
+
+        # 常用的缩放尺寸只换算一次
+        w500 = int(500 * s)
+        w250 = int(250 * s)
+        w200 = int(200 * s)
+        w100 = int(100 * s)
+        w60 = int(60 * s)
+        w50 = int(50 * s)
+        w30 = int(30 * s)
+        w10 = int(10 * s)
 
         # 重新计算游戏区域位置
         self.game_area_x = (screen_width - GRID_WIDTH * self.grid_size) // 2
         self.game_area_y = (screen_height - GRID_HEIGHT * self.grid_size) // 2
 
+        # 游戏画面分区清空用的矩形：常规帧只清这两块，不整屏 fill
+        gs = self.grid_size
+        self.play_clear_rect = pygame.Rect(
+            self.game_area_x - gs, self.game_area_y - gs,
+            GRID_WIDTH * gs + 2 * gs, GRID_HEIGHT * gs + 2 * gs
+        )
+        info_x = self.game_area_x + GRID_WIDTH * gs + int(100 * s)
+        if info_x + 200 > screen_width:
+            info_x = screen_width - 200
+        self.info_clear_rect = pygame.Rect(info_x - w50, 0,
+                                           screen_width - info_x + w50, screen_height)
+
+        # 信息栏各元素位置固定，换算一次供每帧绘制直接取用
+        self.info_panel_x = info_x
+        self.next_label_pos = (info_x, w100)
+        self.next_shape_y = int(150 * s)
+        self.score_pos = (info_x, int(300 * s))
+        self.level_pos = (info_x, int(350 * s))
+        self.score_effect_center = (info_x + 100, int(280 * s))
+
         # 根据分辨率调整按钮大小和位置
-        btn_width = int(200 * self.scale_factor)
-        btn_height = int(50 * self.scale_factor)
-        btn_spacing = int(100 * self.scale_factor)
+        btn_width = w200
+        btn_height = w50
+        btn_spacing = w100
 
         # 调整主菜单按钮位置
-        self.main_menu_buttons = [
-            Button("Start", (screen_width - btn_width) // 2, screen_height // 2 - btn_spacing, btn_width, btn_height,
-                   self.show_levels),
-            Button("Options", (screen_width - btn_width) // 2, screen_height // 2, btn_width, btn_height,
-                   self.show_options),
-            Button("Exit", (screen_width - btn_width) // 2, screen_height // 2 + btn_spacing, btn_width, btn_height,
-                   sys.exit)
-        ]
+        for i, btn in enumerate(self.main_menu_buttons):
+            btn.rect.update((screen_width - btn_width) // 2,
+                            screen_height // 2 + (i - 1) * btn_spacing,
+                            btn_width, btn_height)
 
         # 根据分辨率调整关卡按钮大小和位置
-        self.level_buttons = []
-        for i in range(1, 11):
-            x = (screen_width - int(500 * self.scale_factor)) // 2 + ((i - 1) % 5) * int(100 * self.scale_factor)
-            y = screen_height // 2 - int(50 * self.scale_factor) + ((i - 1) // 5) * int(60 * self.scale_factor)
-            self.level_buttons.append(Button(str(i), x, y, int(50 * self.scale_factor), int(30 * self.scale_factor),
-                                             lambda l=i: self.start_game(l)))
+        for i, btn in enumerate(self.level_buttons, start=1):
+            x = (screen_width - w500) // 2 + ((i - 1) % 5) * w100
+            y = screen_height // 2 - w50 + ((i - 1) // 5) * w60
+            btn.rect.update(x, y, w50, w30)
 
         # 根据分辨率调整选项界面布局
-        option_x = int(50 * self.scale_factor)
-        option_y = int(150 * self.scale_factor)  # 将初始值从100调整为150，增加与标题的距离
-        option_spacing = int(60 * self.scale_factor)
+        option_x = w50
+        option_y = int(150 * s)  # 将初始值从100调整为150，增加与标题的距离
+        option_spacing = w60
 
         # 根据分辨率调整箭头按钮大小和位置
-        arrow_width = int(30 * self.scale_factor)
-        self.arrow_buttons = [
-            Button("<", screen_width - int(250 * self.scale_factor) - arrow_width - int(10 * self.scale_factor),
-                   option_y, arrow_width, int(30 * self.scale_factor), lambda: self.cycle_setting(0, -1)),
-            Button(">", screen_width - int(250 * self.scale_factor) + int(200 * self.scale_factor) + int(
-                10 * self.scale_factor), option_y, arrow_width, int(30 * self.scale_factor),
-                   lambda: self.cycle_setting(0, 1)),
-            Button("<", screen_width - int(250 * self.scale_factor) - arrow_width - int(10 * self.scale_factor),
-                   option_y + option_spacing, arrow_width, int(30 * self.scale_factor),
-                   lambda: self.cycle_setting(1, -1)),
-            Button(">", screen_width - int(250 * self.scale_factor) + int(200 * self.scale_factor) + int(
-                10 * self.scale_factor), option_y + option_spacing, arrow_width, int(30 * self.scale_factor),
-                   lambda: self.cycle_setting(1, 1)),
-            Button("<", screen_width - int(250 * self.scale_factor) - arrow_width - int(10 * self.scale_factor),
-                   option_y + 2 * option_spacing, arrow_width, int(30 * self.scale_factor),
-                   lambda: self.cycle_setting(2, -1)),
-            Button(">", screen_width - int(250 * self.scale_factor) + int(200 * self.scale_factor) + int(
-                10 * self.scale_factor), option_y + 2 * option_spacing, arrow_width, int(30 * self.scale_factor),
-                   lambda: self.cycle_setting(2, 1)),
-            Button("<", screen_width - int(250 * self.scale_factor) - arrow_width - int(10 * self.scale_factor),
-                   option_y + 3 * option_spacing, arrow_width, int(30 * self.scale_factor),
-                   lambda: self.cycle_setting(3, -1)),
-            Button(">", screen_width - int(250 * self.scale_factor) + int(200 * self.scale_factor) + int(
-                10 * self.scale_factor), option_y + 3 * option_spacing, arrow_width, int(30 * self.scale_factor),
-                   lambda: self.cycle_setting(3, 1)),
-            Button("<", screen_width - int(250 * self.scale_factor) - arrow_width - int(10 * self.scale_factor),
-                   option_y + 4 * option_spacing, arrow_width, int(30 * self.scale_factor),
-                   lambda: self.cycle_setting(4, -1)),
-            Button(">", screen_width - int(250 * self.scale_factor) + int(200 * self.scale_factor) + int(
-                10 * self.scale_factor), option_y + 4 * option_spacing, arrow_width, int(30 * self.scale_factor),
-                   lambda: self.cycle_setting(4, 1)),
-            Button("<", screen_width - int(250 * self.scale_factor) - arrow_width - int(10 * self.scale_factor),
-                   option_y + 5 * option_spacing, arrow_width, int(30 * self.scale_factor),
-                   lambda: self.cycle_setting(5, -1)),
-            Button(">", screen_width - int(250 * self.scale_factor) + int(200 * self.scale_factor) + int(
-                10 * self.scale_factor), option_y + 5 * option_spacing, arrow_width, int(30 * self.scale_factor),
-                   lambda: self.cycle_setting(5, 1)),
-        ]
+        right_x = screen_width - w250  # 选项值按钮的左边缘
+        arrow_left = right_x - w30 - w10
+        arrow_right = right_x + w200 + w10
+        for row in range(6):
+            y = option_y + row * option_spacing
+            self.arrow_buttons[2 * row].rect.update(arrow_left, y, w30, w30)
+            self.arrow_buttons[2 * row + 1].rect.update(arrow_right, y, w30, w30)
 
         # 更新选项标签和按钮
         self.option_labels = [
@@ -527,47 +754,31 @@ class Game:
             ("Shake Intensity", option_x, option_y + 4 * option_spacing),
             ("Disable S/Z Shapes", option_x, option_y + 5 * option_spacing)  # 禁用S/Z型方块选项
         ]
+        # 标签内容固定，预存 (表面, 位置)，绘制时只剩位块传送
+        self.option_label_surfs = [(self.render_text(label, 36, ColorScheme.TEXT), x, y)
+                                   for label, x, y in self.option_labels]
 
-        self.options_buttons = [
-            Button("On" if self.temp_settings["fullscreen"] else "Off",
-                   screen_width - int(250 * self.scale_factor), option_y, int(200 * self.scale_factor),
-                   int(30 * self.scale_factor), self.toggle_fullscreen),
-            Button(f"{self.temp_settings['resolution'][0]}x{self.temp_settings['resolution'][1]}",
-                   screen_width - int(250 * self.scale_factor), option_y + option_spacing, int(200 * self.scale_factor),
-                   int(30 * self.scale_factor), self.cycle_resolution),
-            Button("On" if self.temp_settings["ghost_shape"] else "Off",
-                   screen_width - int(250 * self.scale_factor), option_y + 2 * option_spacing,
-                   int(200 * self.scale_factor), int(30 * self.scale_factor), self.toggle_ghost_shape),
-            Button("On" if self.temp_settings["screen_shake"] else "Off",
-                   screen_width - int(250 * self.scale_factor), option_y + 3 * option_spacing,
-                   int(200 * self.scale_factor), int(30 * self.scale_factor), self.toggle_screen_shake),
-            Button(str(self.temp_settings["shake_intensity"]),
-                   screen_width - int(250 * self.scale_factor), option_y + 4 * option_spacing,
-                   int(200 * self.scale_factor), int(30 * self.scale_factor), self.adjust_shake_intensity),
-            Button("On" if self.temp_settings["disable_sz_shapes"] else "Off",  # 新增：禁用S/Z型方块按钮
-                   screen_width - int(250 * self.scale_factor), option_y + 5 * option_spacing,
-                   int(200 * self.scale_factor), int(30 * self.scale_factor), self.toggle_disable_sz_shapes),
-            Button("Apply", screen_width - int(250 * self.scale_factor), option_y + 6 * option_spacing,
-                   int(200 * self.scale_factor), int(30 * self.scale_factor), self.apply_settings),
-        ]
+        for row, btn in enumerate(self.options_buttons):
+            btn.rect.update(right_x, option_y + row * option_spacing, w200, w30)
+        self.refresh_option_texts()
 
     def cycle_setting(self, index, direction):
         """循环设置选项"""
         if index == 0:  # 全屏模式
             self.temp_settings["fullscreen"] = not self.temp_settings["fullscreen"]
-            self.options_buttons[0].text = "On" if self.temp_settings["fullscreen"] else "Off"
+            self.options_buttons[0].set_text("On" if self.temp_settings["fullscreen"] else "Off")
         elif index == 1:  # 分辨率
             current = RESOLUTIONS.index(self.temp_settings["resolution"])
             new_index = (current + direction) % len(RESOLUTIONS)
             self.temp_settings["resolution"] = RESOLUTIONS[new_index]
-            self.options_buttons[
-                1].text = f"{self.temp_settings['resolution'][0]}x{self.temp_settings['resolution'][1]}"
+            self.options_buttons[1].set_text(
+                f"{self.temp_settings['resolution'][0]}x{self.temp_settings['resolution'][1]}")
         elif index == 2:  # 幽灵方块
             self.temp_settings["ghost_shape"] = not self.temp_settings["ghost_shape"]
-            self.options_buttons[2].text = "On" if self.temp_settings["ghost_shape"] else "Off"
+            self.options_buttons[2].set_text("On" if self.temp_settings["ghost_shape"] else "Off")
         elif index == 3:  # 屏幕震动效果
             self.temp_settings["screen_shake"] = not self.temp_settings["screen_shake"]
-            self.options_buttons[3].text = "On" if self.temp_settings["screen_shake"] else "Off"
+            self.options_buttons[3].set_text("On" if self.temp_settings["screen_shake"] else "Off")
         elif index == 4:  # 震动强度
             new_intensity = self.temp_settings["shake_intensity"] + direction
             if new_intensity < 1:
@@ -575,17 +786,20 @@ class Game:
             elif new_intensity > 10:
                 new_intensity = 10
             self.temp_settings["shake_intensity"] = new_intensity
-            self.options_buttons[4].text = str(new_intensity)
+            self.options_buttons[4].set_text(str(new_intensity))
         elif index == 5:  # 禁用S/Z型方块
             self.temp_settings["disable_sz_shapes"] = not self.temp_settings["disable_sz_shapes"]
-            self.options_buttons[5].text = "On" if self.temp_settings["disable_sz_shapes"] else "Off"
+            self.options_buttons[5].set_text("On" if self.temp_settings["disable_sz_shapes"] else "Off")
 
     def toggle_screen_shake(self):
         """切换屏幕震动效果"""
         self.temp_settings["screen_shake"] = not self.temp_settings["screen_shake"]
 
     def handle_events(self):
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if events:
+            self.menu_dirty = True  # 任何输入都可能改变悬停/选中状态
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -601,6 +815,12 @@ class Game:
 
             if event.type == pygame.MOUSEBUTTONDOWN:
                 pos = pygame.mouse.get_pos()
+                # 暂停菜单的点击在事件里判定一次，不再每帧轮询鼠标按键状态
+                if self.state == GameState.PAUSED and event.button == 1:
+                    for i, rect in enumerate(self.paused_option_rects):
+                        if rect.collidepoint(pos):
+                            self.select_paused_option(i)
+                            break
                 # 处理箭头按钮点击
                 for btn in self.arrow_buttons:
                     if btn.rect.collidepoint(pos) and btn.action:
@@ -626,8 +846,7 @@ class Game:
                         self.tetris.hard_drop()
                         self.shake_duration = 10 if self.screen_shake_enabled else 0
                     elif event.key == pygame.K_ESCAPE:  # 游戏内按下ESC暂停
-                        self.state = GameState.PAUSED
-                        self.paused_surface = apply_blur(self.screen.copy())
+                        self.enter_pause()
 
                 # 暂停菜单的按键处理
                 elif self.state == GameState.PAUSED:
@@ -636,13 +855,7 @@ class Game:
                     elif event.key == pygame.K_DOWN:
                         self.paused_selected = (self.paused_selected + 1) % 3
                     elif event.key == pygame.K_RETURN:
-                        if self.paused_selected == 0:  # Continue
-                            self.state = GameState.GAME
-                        elif self.paused_selected == 1:  # Reset
-                            self.start_game(self.tetris.level)
-                            self.state = GameState.GAME
-                        elif self.paused_selected == 2:  # Main Menu
-                            self.state = GameState.MAIN_MENU
+                        self.select_paused_option(self.paused_selected)
                     elif event.key == pygame.K_ESCAPE:  # 暂停时ESC恢复游戏
                         self.state = GameState.GAME
 
@@ -657,7 +870,7 @@ class Game:
                         self.state = GameState.LEVEL_SELECT
 
     def update_title_positions(self):
-        """更新标题字母位置"""
+        """更新标题字母位置（六个字母的三角运算整批用 numpy 完成）"""
         time = pygame.time.get_ticks() / 1000
         mouse_pos = pygame.mouse.get_pos()
 
@@ -667,33 +880,25 @@ class Game:
         # 计算标题起始位置，确保完全居中，并向右移动20像素
         title_start_x = (self.resolution[0] - total_width) // 2 + 20
 
-        for i, pos in enumerate(self.title_positions):
-            # 基础浮动
-            y_offset = math.sin(time * 2 + i * 0.5) * 15
-
-            # 鼠标斥力
-            dx = title_start_x + i * 60 - mouse_pos[0]
-            dy = self.title_center[1] + y_offset - mouse_pos[1]
-            distance = math.hypot(dx, dy)
-
-            if distance < 100:
-                angle = math.atan2(dy, dx)
-                push_force = (100 - distance) * 0.3
-                x = title_start_x + i * 60 + math.cos(angle) * push_force
-                y = self.title_center[1] + y_offset + math.sin(angle) * push_force
-            else:
-                x = title_start_x + i * 60
-                y = self.title_center[1] + y_offset
+        # 基础浮动
+        base_x = title_start_x + np.arange(6) * 60
+        base_y = self.title_center[1] + np.sin(time * 2 + np.arange(6) * 0.5) * 15
 
-            pos['x'] = x
-            pos['y'] = y
+        # 鼠标斥力
+        dx = base_x - mouse_pos[0]
+        dy = base_y - mouse_pos[1]
+        distance = np.hypot(dx, dy)
+        # cos(atan2(dy,dx)) == dx/distance，直接用比值代替三次超越函数调用
+        scale = np.where(distance < 100, (100 - distance) * 0.3, 0.0) / np.maximum(distance, 1e-6)
+        x = base_x + dx * scale
+        y = base_y + dy * scale
 
-    def draw_title(self):
-        """绘制动态标题"""
-        self.update_title_positions()
-        font = pygame.font.Font(None, 120)
+        for i, pos in enumerate(self.title_positions):
+            pos['x'] = x[i]
+            pos['y'] = y[i]
 
-        # 定义标题字母颜色
+    def build_title_glyphs(self):
+        """预渲染标题字母：每个字母一对（黑色轮廓, 彩色本体）表面"""
         title_colors = [
             pygame.Color("#FF0000"),  # T - 红色
             pygame.Color("#00FF00"),  # E - 绿色
@@ -702,19 +907,27 @@ class Game:
             pygame.Color("#FFFF00"),  # I - 黄色
             pygame.Color("#00FFFF")  # S - 青色
         ]
+        font = get_font(120)
+        black = pygame.Color("#000000")
+        self.title_glyphs = []
+        for i, char in enumerate(self.title_letters):
+            outline = font.render(char, True, black)
+            body = font.render(char, True, title_colors[i])
+            # 四个偏移的黑色轮廓与彩色本体合成到同一张表面，绘制时每个字母只需一次传送
+            glyph = pygame.Surface((outline.get_width() + 4, outline.get_height() + 4),
+                                   pygame.SRCALPHA)
+            for dx, dy in [(0, 0), (0, 4), (4, 0), (4, 4)]:
+                glyph.blit(outline, (dx, dy))
+            glyph.blit(body, (2, 2))
+            self.title_glyphs.append(glyph.convert_alpha())
+
+    def draw_title(self):
+        """绘制动态标题"""
+        self.update_title_positions()
 
         for i, pos in enumerate(self.title_positions):
-            # 先绘制黑色轮廓
-            text = font.render(pos['char'], True, pygame.Color("#000000"))
-            # 绘制轮廓的四个偏移位置
-            for dx, dy in [(-2, -2), (-2, 2), (2, -2), (2, 2)]:
-                text_rect = text.get_rect(center=(pos['x'] + dx, pos['y'] + dy))
-                self.screen.blit(text, text_rect)
-
-            # 再绘制实际颜色的字母
-            text = font.render(pos['char'], True, title_colors[i])
-            text_rect = text.get_rect(center=(pos['x'], pos['y']))
-            self.screen.blit(text, text_rect)
+            glyph = self.title_glyphs[i]
+            self.screen.blit(glyph, glyph.get_rect(center=(pos['x'], pos['y'])))
 
     def draw_main_menu(self):
         self.screen.fill(ColorScheme.BACKGROUND)
@@ -726,53 +939,59 @@ class Game:
             btn.draw(self.screen)  # 使用新的绘制按钮方法
         pygame.display.flip()
 
-    def draw_paused_menu(self):
-        # 绘制模糊背景
-        self.screen.blit(self.paused_surface, (0, 0))
+    def enter_pause(self):
+        """ 进入暂停：把模糊背景、遮罩和标题一次性烘焙进暂停背景 """
+        base = apply_blur(self.screen.copy())
 
-        # 绘制半透明遮罩
-        overlay = pygame.Surface(self.resolution, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
-
-        # 绘制菜单选项
-        font = pygame.font.Font(None, 72)
-        text = font.render("PAUSED", True, ColorScheme.TEXT)
-        text_rect = text.get_rect(center=(self.resolution[0] // 2, self.resolution[1] // 2 - 100))
-        self.screen.blit(text, text_rect)
+        # 半透明遮罩
+        base.blit(self.dark_overlay, (0, 0))
+
+        # 标题
+        text = self.render_text("PAUSED", 72, ColorScheme.TEXT)
+        base.blit(text, text.get_rect(center=(self.resolution[0] // 2, self.resolution[1] // 2 - 100)))
+
+        self.paused_surface = base
+        self.paused_full_redraw = True
+        self.state = GameState.PAUSED
+
+    def draw_paused_menu(self):
+        # 菜单选项所在的横条是每帧唯一变化的区域
+        menu_rect = pygame.Rect(0, self.resolution[1] // 2 - 30, self.resolution[0], 160)
+        if self.paused_full_redraw:
+            self.screen.blit(self.paused_surface, (0, 0))  # 第一帧整屏绘制烘焙背景
+        else:
+            self.screen.blit(self.paused_surface, menu_rect.topleft, menu_rect)  # 之后只恢复菜单区域
 
         options = ["Continue", "Restart", "Main Menu"]
         option_rects = []
         for i, option in enumerate(options):
             color = ColorScheme.TEXT if i == self.paused_selected else ColorScheme.BUTTON
-            font = pygame.font.Font(None, 48)
-            text = font.render(option, True, color)
+            text = self.render_text(option, 48, color)
             text_rect = text.get_rect(center=(self.resolution[0] // 2, self.resolution[1] // 2 + i * 50))
             self.screen.blit(text, text_rect)
             option_rects.append(text_rect)
+        self.paused_option_rects = option_rects  # 点击判定在 handle_events 里做
 
-        # 处理鼠标选择
+        # 处理鼠标悬停选择
         mouse_pos = pygame.mouse.get_pos()
         for i, rect in enumerate(option_rects):
             if rect.collidepoint(mouse_pos):
                 self.paused_selected = i
-                if pygame.mouse.get_pressed()[0]:  # 左键点击
-                    if self.paused_selected == 0:  # Continue
-                        self.state = GameState.GAME
-                    elif self.paused_selected == 1:  # Reset
-                        self.start_game(self.tetris.level)
-                        self.state = GameState.GAME
-                    elif self.paused_selected == 2:  # Main Menu
-                        self.state = GameState.MAIN_MENU
 
-        pygame.display.flip()
+        if self.paused_full_redraw:
+            pygame.display.flip()
+            self.paused_full_redraw = False
+        else:
+            pygame.display.update(menu_rect)  # 脏矩形：只推送菜单区域
 
     def draw_levels(self):
-        self.screen.fill(ColorScheme.BACKGROUND)
         self.update_background_shapes()
+        if not self.menu_dirty:  # 画面与上一帧相同，跳过整屏重绘
+            return
+        self.menu_dirty = False
+        self.screen.fill(ColorScheme.BACKGROUND)
         self.draw_background_shapes()
-        font = pygame.font.Font(None, 48)
-        text = font.render("Select Level", True, ColorScheme.TEXT)
+        text = self.render_text("Select Level", 48, ColorScheme.TEXT)
         # 计算标题居中位置
         text_rect = text.get_rect(center=(self.resolution[0] // 2, 100))
         self.screen.blit(text, text_rect)
@@ -785,7 +1004,7 @@ class Game:
         if option_type in ["On", "Off"]:
             self.dropdown_options = ["On", "Off"]
         elif "x" in option_type:
-            self.dropdown_options = [f"{w}x{h}" for w, h in RESOLUTIONS]
+            self.dropdown_options = list(RESOLUTION_BY_TEXT)
 
     def update_selected_option(self):
         selected_option = self.dropdown_options[self.dropdown_selected]
@@ -797,42 +1016,40 @@ class Game:
                     # 根据按钮的位置判断是修改全屏还是幽灵方块
                     if btn == self.options_buttons[0]:  # 全屏模式
                         self.temp_settings["fullscreen"] = selected_option == "On"
-                        self.options_buttons[0].text = selected_option
+                        self.options_buttons[0].set_text(selected_option)
                     elif btn == self.options_buttons[2]:  # 幽灵方块
                         self.temp_settings["ghost_shape"] = selected_option == "On"
-                        self.options_buttons[2].text = selected_option
+                        self.options_buttons[2].set_text(selected_option)
                 elif "x" in btn.text:  # 分辨率
-                    # 仅在处理分辨率选项时执行字符串分割
-                    if "x" in selected_option:
-                        w, h = map(int, selected_option.split("x"))
-                        self.temp_settings["resolution"] = (w, h)
-                        self.options_buttons[1].text = selected_option
+                    # 分辨率数值已有现成映射，不再做字符串解析
+                    resolution = RESOLUTION_BY_TEXT.get(selected_option)
+                    if resolution:
+                        self.temp_settings["resolution"] = resolution
+                        self.options_buttons[1].set_text(selected_option)
                 break
 
     def draw_options(self):
-        self.screen.fill(ColorScheme.BACKGROUND)
         self.update_background_shapes()
+        if not self.menu_dirty:  # 画面与上一帧相同，跳过整屏重绘
+            return
+        self.menu_dirty = False
+        self.screen.fill(ColorScheme.BACKGROUND)
         self.draw_background_shapes()
 
         # 添加深色蒙版
-        overlay = pygame.Surface(self.resolution, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))  # 半透明黑色（RGBA：0,0,0,128）
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.dark_overlay, (0, 0))
 
         # 绘制标题在左上角
-        font = pygame.font.Font(None, 48)
-        text = font.render("Options", True, ColorScheme.TEXT)
+        text = self.render_text("Options", 48, ColorScheme.TEXT)
         self.screen.blit(text, (50, 50))
 
-        # 绘制选项名
-        font = pygame.font.Font(None, 36)
-        for label, x, y in self.option_labels:
-            text = font.render(label, True, ColorScheme.TEXT)
-            self.screen.blit(text, (x, y))
+        # 绘制选项名（表面已在 update_layout 预存）
+        for surf, x, y in self.option_label_surfs:
+            self.screen.blit(surf, (x, y))
 
         # 根据screen shake的状态设置震动强度选项的颜色
         if not self.temp_settings["screen_shake"]:
-            color = pygame.Color("#808080")  # 灰色
+            color = ColorScheme.BUTTON_DISABLED  # 灰色
         else:
             color = ColorScheme.BUTTON
 
@@ -844,76 +1061,69 @@ class Game:
         self.buttons = self.options_buttons
         self.buttons[4].color = color  # 设置震动强度按钮的颜色
 
+        # 鼠标位置每帧只向 SDL 查询一次
+        mouse_pos = pygame.mouse.get_pos()
+
         # 绘制选项值按钮
         for btn in self.buttons:
-            btn.hovered = btn.rect.collidepoint(pygame.mouse.get_pos())
+            btn.hovered = btn.rect.collidepoint(mouse_pos)
             btn.draw(self.screen)
 
         # 绘制箭头按钮
         for btn in self.arrow_buttons:
-            btn.hovered = btn.rect.collidepoint(pygame.mouse.get_pos())
+            btn.hovered = btn.rect.collidepoint(mouse_pos)
             btn.draw(self.screen)
 
         pygame.display.flip()
 
     def draw_next_shape(self):
-        screen_width = self.resolution[0]
-        # 调整信息栏位置，增加与游戏区域的间距
-        info_panel_x = self.game_area_x + GRID_WIDTH * self.grid_size + int(100 * self.scale_factor)
-        if info_panel_x + 200 > screen_width:
-            info_panel_x = screen_width - 200
-
-        # 根据缩放比例调整字体大小
-        font = pygame.font.Font(None, int(36 * self.scale_factor))
-        text = font.render("Next Shape:", True, ColorScheme.TEXT)
-        self.screen.blit(text, (info_panel_x, int(100 * self.scale_factor)))
-
-        start_x = info_panel_x
-        start_y = int(150 * self.scale_factor)
-        for y, row in enumerate(self.tetris.next_shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    pygame.draw.rect(self.screen, ColorScheme.SHAPE_COLORS[self.tetris.next_color], (
-                        start_x + x * self.grid_size,
-                        start_y + y * self.grid_size,
-                        self.grid_size - 1, self.grid_size - 1
-                    ))
+        # 信息栏位置已在 update_layout 算好
+        text = self.render_text("Next Shape:", int(36 * self.scale_factor), ColorScheme.TEXT)
+        self.screen.blit(text, self.next_label_pos)
+
+        start_x = self.info_panel_x
+        start_y = self.next_shape_y
+        sprite = self.cell_fill_sprites[self.tetris.next_color]
+        self.screen.blits(
+            [(sprite, (start_x + x * self.grid_size, start_y + y * self.grid_size))
+             for y, row in enumerate(ROTATIONS[self.tetris.next_shape_id][0])
+             for x, cell in enumerate(row) if cell],
+            doreturn=False)
+
+    def build_score_effect_frames(self, text):
+        """ 预渲染整段 45 帧加分特效：颜色渐变与缩放曲线都是确定的 """
+        frames = []
+        for frames_left in range(45, 0, -1):
+            t = 1 - frames_left / 45
+            r = min(255, int(255 * t))
+            g = max(0, 255 - int(255 * t))
+            font = get_font(int(48 * self.scale_factor * (1.0 + t * 0.5)))
+            frames.append(font.render(text, True, (r, g, 0)).convert_alpha())
+        return frames
 
     def draw_game_info(self):
-        screen_width = self.resolution[0]
-        # 调整信息栏位置，增加与游戏区域的间距
-        info_panel_x = self.game_area_x + GRID_WIDTH * self.grid_size + int(100 * self.scale_factor)
-        if info_panel_x + 200 > screen_width:
-            info_panel_x = screen_width - 200
-
-        # 根据缩放比例调整字体大小
-        font = pygame.font.Font(None, int(36 * self.scale_factor))
-        text = font.render(f"Score: {self.tetris.score}", True, ColorScheme.TEXT)
-        self.screen.blit(text, (info_panel_x, int(300 * self.scale_factor)))
-
-        # 绘制改进后的加分特效
+        # 分数文本只在数值变化时重新渲染（信息栏位置已在 update_layout 算好）
+        if self.tetris.score != self.score_surf_value:
+            self.score_surf_value = self.tetris.score
+            self.score_surf = get_font(int(36 * self.scale_factor)).render(
+                f"Score: {self.tetris.score}", True, ColorScheme.TEXT)
+        self.screen.blit(self.score_surf, self.score_pos)
+
+        # 绘制改进后的加分特效（整段动画已预渲染，按剩余帧数查表）
         if self.tetris.score_effect_frames > 0:
-            # 计算渐变色
-            r = min(255, self.tetris.score_effect_color[0] + int(255 * (1 - self.tetris.score_effect_frames / 45)))
-            g = max(0, self.tetris.score_effect_color[1] - int(255 * (1 - self.tetris.score_effect_frames / 45)))
-            b = self.tetris.score_effect_color[2]
-            color = (r, g, b)
-
-            # 计算缩放比例
-            self.tetris.score_effect_scale = 1.0 + (1 - self.tetris.score_effect_frames / 45) * 0.5
-
-            # 创建渐变文本表面
-            effect_font = pygame.font.Font(None, int(48 * self.scale_factor * self.tetris.score_effect_scale))
-            effect_text = effect_font.render(self.tetris.score_effect, True, color)
-
-            # 绘制主文本
-            effect_rect = effect_text.get_rect(center=(info_panel_x + 100, int(280 * self.scale_factor)))
+            frames = self.score_effect_cache.get(self.tetris.score_effect)
+            if frames is None:
+                frames = self.build_score_effect_frames(self.tetris.score_effect)
+                self.score_effect_cache[self.tetris.score_effect] = frames
+            effect_text = frames[45 - self.tetris.score_effect_frames]
+            effect_rect = effect_text.get_rect(center=self.score_effect_center)
             self.screen.blit(effect_text, effect_rect)
 
             self.tetris.score_effect_frames -= 1
 
-        text = font.render(f"Level: {self.tetris.level}", True, ColorScheme.TEXT)
-        self.screen.blit(text, (info_panel_x, int(350 * self.scale_factor)))
+        text = self.render_text(f"Level: {self.tetris.level}", int(36 * self.scale_factor),
+                                ColorScheme.TEXT)
+        self.screen.blit(text, self.level_pos)
 
     def toggle_fullscreen(self):
         self.temp_settings["fullscreen"] = not self.temp_settings["fullscreen"]
@@ -940,6 +1150,8 @@ class Game:
         self.screen_shake_enabled = self.temp_settings["screen_shake"]
         self.shake_intensity = self.temp_settings["shake_intensity"]
         self.disable_sz_shapes = self.temp_settings["disable_sz_shapes"]  # 应用禁用S/Z型方块设置
+        # 重建形状编号池，过滤S和Z型方块（编号5和6）
+        self.shape_pool = [i for i in range(len(SHAPES)) if not (self.disable_sz_shapes and i in (5, 6))]
         self.init_display()
         # 清除背景方块并重新初始化
         self.background_shapes = []
@@ -947,12 +1159,22 @@ class Game:
 
     def start_game(self, level):
         self.tetris = Tetris(level)
+        self.grid_dirty = True  # 新开局盘面为空，重建烘焙表面
         self.tetris.game = self  # 设置game属性
         # 重新生成下一个形状确保应用过滤条件
-        self.tetris.next_shape = self.tetris.choose_shape()
+        self.tetris.next_shape_id = self.tetris.choose_shape()
         self.tetris.next_color = self.tetris.choose_next_color()
         self.state = GameState.GAME
 
+    def select_paused_option(self, index):
+        """执行暂停菜单选项"""
+        if index == 0:  # Continue
+            self.state = GameState.GAME
+        elif index == 1:  # Restart
+            self.start_game(self.tetris.level)
+        elif index == 2:  # Main Menu
+            self.state = GameState.MAIN_MENU
+
     def show_main_menu(self):
         self.state = GameState.MAIN_MENU
 
@@ -963,45 +1185,64 @@ class Game:
         self.state = GameState.LEVEL_SELECT
 
     def draw_grid(self):
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                if self.tetris.grid[y][x]:
-                    color = ColorScheme.SHAPE_COLORS[self.tetris.grid[y][x] - 1]
-                    # 仅在screen_shake_enabled为True时应用震动偏移量
-                    shake_offset_x = int(self.shake_offset[0]) if self.screen_shake_enabled else 0
-                    shake_offset_y = int(self.shake_offset[1]) if self.screen_shake_enabled else 0
-                    pygame.draw.rect(self.screen, pygame.Color("#000000"), (
-                        self.game_area_x + x * self.grid_size - 2 + shake_offset_x,
-                        self.game_area_y + y * self.grid_size - 2 + shake_offset_y,
-                        self.grid_size + 3, self.grid_size + 3
-                    ))
-                    pygame.draw.rect(self.screen, color, (
-                        self.game_area_x + x * self.grid_size + shake_offset_x,
-                        self.game_area_y + y * self.grid_size + shake_offset_y,
-                        self.grid_size - 1, self.grid_size - 1
-                    ))
+        """ 绘制已锁定的方块：仅在盘面变化后重建烘焙表面，其余帧只整块传送 """
+        if self.grid_dirty:
+            self.grid_surface.fill((0, 0, 0, 0))
+            gs = self.grid_size
+            sprites = self.cell_sprites
+            colors = ColorScheme.SHAPE_COLORS
+            self.grid_surface.blits(
+                [(sprites[tuple(colors[cell - 1])], (x * gs, y * gs))
+                 for y, row in enumerate(self.tetris.grid)
+                 for x, cell in enumerate(row) if cell],
+                doreturn=False)
+            self.grid_dirty = False
+        # 仅在screen_shake_enabled为True时应用震动偏移量
+        shake_offset_x = int(self.shake_offset[0]) if self.screen_shake_enabled else 0
+        shake_offset_y = int(self.shake_offset[1]) if self.screen_shake_enabled else 0
+        self.screen.blit(self.grid_surface, (
+            self.game_area_x - 2 + shake_offset_x,
+            self.game_area_y - 2 + shake_offset_y
+        ))
 
     def draw_game(self):
         """绘制游戏画面，应用震动效果"""
         if self.screen_shake_enabled:
             self.apply_shake()
-        self.screen.fill(ColorScheme.BACKGROUND)
+        # 震动、粒子和结算遮罩可能触及屏幕任意位置，这些帧（及其后一帧，
+        # 残影还留在屏上）仍整屏清空兜底；常规帧只清空玩法区与信息栏两块区域
+        overdraw = (self.tetris.game_over or self.shake_offset != (0, 0)
+                    or len(self.tetris.particles['px']) > 0)
+        if self.menu_dirty or overdraw or self.game_overdraw:
+            self.screen.fill(ColorScheme.BACKGROUND)
+            self.menu_dirty = False
+        else:
+            self.screen.fill(ColorScheme.BACKGROUND, self.play_clear_rect)
+            self.screen.fill(ColorScheme.BACKGROUND, self.info_clear_rect)
+        self.game_overdraw = overdraw
         self.draw_grid()
         self.draw_current_shape()
         self.draw_next_shape()
         self.draw_game_info()
 
-        # 绘制粒子效果
-        for p in self.tetris.particles:
-            alpha = int(255 * (p.life / 60))
-            size = int(p.size * (p.life / 60))
-            color = (*p.color[:3], alpha)  # 转换为RGBA格式
-            # 添加随机偏移增强破碎感
-            offset_x = random.randint(-2, 2)
-            offset_y = random.randint(-2, 2)
-            pygame.draw.circle(self.screen, color,
-                               (int(p.x) + offset_x, int(p.y) + offset_y),
-                               max(1, size))
+        # 绘制粒子效果：按 (颜色, 半径) 缓存的圆形贴图配合表面透明度，免去逐粒子光栅化
+        p = self.tetris.particles
+        lut = self.particle_sprites
+        n = len(p['px'])
+        if n:
+            # 随机偏移增强破碎感，整批生成一次代替逐粒子两次 randint
+            xs = (p['px'] + np.random.randint(-2, 3, n)).astype(np.int32)
+            ys = (p['py'] + np.random.randint(-2, 3, n)).astype(np.int32)
+            for x, y, life, psize, cidx in zip(xs, ys, p['life'], p['size'], p['color']):
+                size = max(1, int(psize * (life / 60)))
+                sprite = lut.get((cidx, size))
+                if sprite is None:
+                    sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                    pygame.draw.circle(sprite, ColorScheme.SHAPE_COLORS[cidx], (size, size), size)
+                    sprite = sprite.convert_alpha()
+                    lut[(cidx, size)] = sprite
+                sprite.set_alpha(int(255 * (life / 60)))
+                self.screen.blit(sprite, (x - size, y - size))
 
         # 更新幽灵方块特效
         if self.tetris.ghost_effect_active:
@@ -1028,36 +1269,38 @@ class Game:
     def draw_game_over(self):
         """绘制游戏结束界面"""
         # 绘制半透明遮罩
-        overlay = pygame.Surface(self.resolution, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.dark_overlay, (0, 0))
 
         # 绘制游戏结束文本
-        font = pygame.font.Font(None, 72)
-        text = font.render("Game Over", True, ColorScheme.TEXT)
+        text = self.render_text("Game Over", 72, ColorScheme.TEXT)
         text_rect = text.get_rect(center=(self.resolution[0] // 2, self.resolution[1] // 2 - 50))
         self.screen.blit(text, text_rect)
 
-        # 绘制得分信息
-        font = pygame.font.Font(None, 48)
-        text = font.render(f"Final Score: {self.tetris.score}", True, ColorScheme.TEXT)
+        # 绘制得分信息（分数值无上限，用单槽缓存而不是共享文本缓存）
+        if self.tetris.score != self.final_score_value:
+            self.final_score_value = self.tetris.score
+            self.final_score_surf = get_font(48).render(
+                f"Final Score: {self.tetris.score}", True, ColorScheme.TEXT)
+        text = self.final_score_surf
         text_rect = text.get_rect(center=(self.resolution[0] // 2, self.resolution[1] // 2 + 50))
         self.screen.blit(text, text_rect)
 
         # 绘制返回主菜单的提示
-        font = pygame.font.Font(None, 36)
-        text = font.render("Press Space to return to Level Select", True, ColorScheme.TEXT)
+        text = self.render_text("Press Space to return to Level Select", 36, ColorScheme.TEXT)
         text_rect = text.get_rect(center=(self.resolution[0] // 2, self.resolution[1] // 2 + 150))
         self.screen.blit(text, text_rect)
 
     def apply_shake(self):
         """应用震动效果"""
         if self.shake_duration > 0 and self.screen_shake_enabled:
-            # 随机生成震动偏移量
+            # 从环形表取预生成的偏移，按当前强度缩放（表值范围 [-10, 10]）
+            k = self.shake_intensity / 10
+            cursor = self.shake_cursor
             self.shake_offset = (
-                random.randint(-self.shake_intensity, self.shake_intensity),
-                random.randint(-self.shake_intensity, self.shake_intensity)
+                int(self.shake_table[cursor] * k),
+                int(self.shake_table[cursor + 1] * k)
             )
+            self.shake_cursor = (cursor + 2) & 4095
             self.shake_duration -= 1
         else:
             self.shake_offset = (0, 0)
@@ -1065,8 +1308,12 @@ class Game:
 
     def run(self):
         while True:
+            self.dt = self.clock.tick(STATE_FPS.get(self.state, FPS))  # 上一帧耗时，驱动各处计时
             self.handle_events()
-            self.clock.tick(FPS)
+
+            if self.state != self.prev_state:
+                self.menu_dirty = True  # 切换界面后第一帧必须整屏重绘
+                self.prev_state = self.state
 
             if self.state == GameState.MAIN_MENU:
                 self.draw_main_menu()
@@ -1076,7 +1323,7 @@ class Game:
                 self.draw_options()
             elif self.state == GameState.GAME:
                 if not self.tetris.game_over:
-                    self.tetris.update()
+                    self.tetris.update(self.dt)
                     self.tetris.update_particles()  # 粒子更新
                 self.draw_game()
             elif self.state == GameState.PAUSED: